@@ -21,6 +21,7 @@ DATA SCIENCE WORKFLOW (follow sequentially, looping as needed):
 
 TOOLS:
 - execute_code(code, timeout): Run Python for ingestion, EDA, modeling, visualization, automation.
+- query_dataset(sql, max_rows): Answer filter/aggregate questions with one SQL SELECT over ./root datasets without loading them (FROM "data/sales.csv").
 - get_current_datetime(): Add timestamps to reports and artifact folders.
 
 BEST PRACTICES: